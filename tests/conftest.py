@@ -110,6 +110,30 @@ def sample_user_data() -> Dict[str, Any]:
 
 
 # Pytest configuration
+def pytest_addoption(parser):
+    """Register custom command line options."""
+    parser.addoption(
+        "--runslow",
+        action="store_true",
+        default=False,
+        help="run tests marked as slow",
+    )
+
+
+def pytest_collection_modifyitems(config, items):
+    """Deselect tests marked as slow unless --runslow is given."""
+    if config.getoption("--runslow"):
+        return
+
+    selected, deselected = [], []
+    for item in items:
+        (deselected if "slow" in item.keywords else selected).append(item)
+
+    if deselected:
+        config.hook.pytest_deselected(items=deselected)
+        items[:] = selected
+
+
 def pytest_configure(config):
     """Configure pytest markers and settings."""
     config.addinivalue_line(
@@ -879,5 +879,90 @@ class TestIssuesCustomFieldValidation(unittest.TestCase):
         self.assertTrue(result)
 
 
+class TestIssuesClientCommands:
+    """Test IssuesClient command methods."""
+
+    def test_apply_commands_single_request(self):
+        """Test that combined commands are sent in one POST."""
+        mock_client = Mock(spec=YouTrackClient)
+        mock_client.post.return_value = {"query": "Type {Bug} tag test"}
+
+        issues_client = IssuesClient(mock_client)
+        result = issues_client.apply_commands("DEMO-123", "Type {Bug} tag test")
+
+        assert result == {"query": "Type {Bug} tag test"}
+        mock_client.get.assert_not_called()
+        mock_client.post.assert_called_once_with(
+            "commands",
+            data={
+                "query": "Type {Bug} tag test",
+                "issues": [{"idReadable": "DEMO-123"}],
+            },
+        )
+
+    def test_apply_commands_resolves_internal_id(self):
+        """Test that internal IDs are converted to readable IDs."""
+        mock_client = Mock(spec=YouTrackClient)
+        mock_client.get.return_value = {"idReadable": "DEMO-41"}
+        mock_client.post.return_value = {}
+
+        issues_client = IssuesClient(mock_client)
+        issues_client.apply_commands("3-41", "Priority {Critical}")
+
+        mock_client.get.assert_called_once_with("issues/3-41?fields=idReadable")
+        sent = mock_client.post.call_args.kwargs["data"]
+        assert sent["issues"] == [{"idReadable": "DEMO-41"}]
+
+    def test_apply_commands_returns_requested_issue_fields(self):
+        """Test that requested fields come back with the command response."""
+        mock_client = Mock(spec=YouTrackClient)
+        mock_client.post.return_value = {
+            "issues": [{"id": "3-41", "idReadable": "DEMO-41", "summary": "Test"}]
+        }
+
+        issues_client = IssuesClient(mock_client)
+        result = issues_client.apply_commands(
+            "DEMO-41", "tag test", fields="id,idReadable,summary"
+        )
+
+        assert result["issues"][0]["summary"] == "Test"
+        assert mock_client.post.call_args.args[0] == (
+            "commands?fields=issues(id,idReadable,summary)"
+        )
+
+
+class TestIssuesClientTagLookup:
+    """Test IssuesClient batch tag lookup."""
+
+    def test_find_tags_by_names_single_request(self):
+        """Test that all names are resolved from one tags request."""
+        mock_client = Mock(spec=YouTrackClient)
+        mock_client.get.return_value = [
+            {"id": "6-1", "name": "Deploy"},
+            {"id": "6-2", "name": "urgent"},
+            {"id": "6-3", "name": "bug"},
+        ]
+
+        issues_client = IssuesClient(mock_client)
+        result = issues_client.find_tags_by_names(["deploy", "URGENT", "missing"])
+
+        assert result == {
+            "deploy": {"id": "6-1", "name": "Deploy"},
+            "urgent": {"id": "6-2", "name": "urgent"},
+        }
+        mock_client.get.assert_called_once_with(
+            "tags", params={"$top": 500, "fields": "id,name,owner(id,login,name)"}
+        )
+
+    def test_find_tags_by_names_empty_makes_no_request(self):
+        """Test that an empty name list does not fetch tags."""
+        mock_client = Mock(spec=YouTrackClient)
+
+        issues_client = IssuesClient(mock_client)
+
+        assert issues_client.find_tags_by_names([]) == {}
+        mock_client.get.assert_not_called()
+
+
 if __name__ == "__main__":
     unittest.main()
@@ -90,6 +90,40 @@ class TestSyncWrapper:
         result = wrapped(args='{"project": "TEST", "issue_id": "123"}')
         assert result == {"project": "TEST", "issue_id": "123"}
 
+    @pytest.mark.unit
+    def test_sync_wrapper_skips_processing_for_plain_parameters(self):
+        """Test that plain named parameters bypass process_parameters."""
+
+        def add_tag_to_issue(issue_id, tag_name):
+            return f"{issue_id}:{tag_name}"
+
+        wrapped = sync_wrapper(add_tag_to_issue)
+
+        with patch("youtrack_mcp.mcp_wrappers.process_parameters") as mock_process:
+            result = wrapped(issue_id="DEMO-1", tag_name="deploy")
+
+        assert result == "DEMO-1:deploy"
+        mock_process.assert_not_called()
+
+    @pytest.mark.unit
+    @pytest.mark.parametrize(
+        "kwargs",
+        [
+            {"args": '{"issue_id": "DEMO-1"}'},
+            {"kwargs": {"issue_id": "DEMO-1"}},
+            {"issue_key": "DEMO-1"},
+        ],
+    )
+    def test_sync_wrapper_processes_special_parameters(self, kwargs):
+        """Test that parameters needing unpacking or renaming are still processed."""
+
+        def get_issue(issue_id):
+            return issue_id
+
+        wrapped = sync_wrapper(get_issue)
+
+        assert wrapped(**kwargs) == "DEMO-1"
+
 
 class TestProcessParameters:
     """Test cases for process_parameters function."""
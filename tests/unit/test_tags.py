@@ -4,234 +4,334 @@ Unit tests for YouTrack tag management functionality.
 
 import json
 import pytest
-from unittest.mock import Mock, patch
+from unittest.mock import Mock, call, patch
 
+from youtrack_mcp.api.client import YouTrackClient
 from youtrack_mcp.api.issues import IssuesClient
 from youtrack_mcp.api.projects import ProjectsClient
 from youtrack_mcp.tools.issues.tags import Tags
+from youtrack_mcp.tools.issues.utilities import Utilities
+
+
+@pytest.fixture
+def tags():
+    """Tags tools wired to spec'd API mocks; stubbing a nonexistent method fails fast."""
+    mock_client = Mock(spec_set=YouTrackClient)
+    issues_api = Mock(spec_set=IssuesClient(mock_client))
+    projects_api = Mock(spec_set=ProjectsClient(mock_client))
+    return Tags(issues_api, projects_api)
+
+
+# Shared tag payloads; tests only read them, so no per-test copies are needed
+_TAG_DEPLOY = {"id": "6-1", "name": "deploy", "owner": {"id": "1-1", "login": "admin"}}
+_TAG_URGENT = {"id": "6-2", "name": "urgent", "owner": {"id": "1-1", "login": "admin"}}
+_TAG_BUG = {"id": "6-3", "name": "bug", "owner": {"id": "1-2", "login": "user"}}
+_MOCK_TAGS = [_TAG_DEPLOY, _TAG_URGENT, _TAG_BUG]
+_MOCK_ISSUE_TAGS = [_TAG_DEPLOY, _TAG_URGENT]
+
+# (method, kwargs, stubbed issues_api return values, expected result, expected issues_api calls)
+SUCCESS_CASES = [
+    pytest.param(
+        "get_available_tags",
+        {"query": "deploy", "limit": 10},
+        {"get_tags": _MOCK_TAGS},
+        _MOCK_TAGS,
+        {"get_tags": [call(query="deploy", limit=10)]},
+        id="get_available_tags",
+    ),
+    pytest.param(
+        "get_issue_tags",
+        {"issue_id": "DEMO-123"},
+        {"get_issue_tags": _MOCK_ISSUE_TAGS},
+        _MOCK_ISSUE_TAGS,
+        {"get_issue_tags": [call("DEMO-123")]},
+        id="get_issue_tags",
+    ),
+    pytest.param(
+        "add_tag_to_issue",
+        {"issue_id": "DEMO-123", "tag_name": "deploy"},
+        {
+            "find_tag_by_name": _TAG_DEPLOY,
+            "add_tag_to_issue": {"id": "DEMO-123", "tags": [_TAG_DEPLOY]},
+        },
+        {"id": "DEMO-123", "tags": [_TAG_DEPLOY]},
+        {
+            "find_tag_by_name": [call("deploy")],
+            "add_tag_to_issue": [call("DEMO-123", "6-1")],
+        },
+        id="add_tag_to_issue",
+    ),
+    pytest.param(
+        "remove_tag_from_issue",
+        {"issue_id": "DEMO-123", "tag_name": "deploy"},
+        {
+            "find_tag_by_name": _TAG_DEPLOY,
+            "remove_tag_from_issue": True,
+        },
+        {"success": True, "message": "Tag 'deploy' removed from issue DEMO-123"},
+        {
+            "find_tag_by_name": [call("deploy")],
+            "remove_tag_from_issue": [call("DEMO-123", "6-1")],
+        },
+        id="remove_tag_from_issue",
+    ),
+    pytest.param(
+        "replace_tag_on_issue",
+        {"issue_id": "DEMO-123", "old_tag_name": "Deploy", "new_tag_name": "bug"},
+        {
+            "get_issue_tags": _MOCK_ISSUE_TAGS,
+            "find_tag_by_name": _TAG_BUG,
+            "set_issue_tags": {"id": "DEMO-123", "tags": [_TAG_URGENT, _TAG_BUG]},
+        },
+        {"id": "DEMO-123", "tags": [_TAG_URGENT, _TAG_BUG]},
+        {
+            "get_issue_tags": [call("DEMO-123")],
+            "find_tag_by_name": [call("bug")],
+            "set_issue_tags": [call("DEMO-123", ["6-2", "6-3"])],
+        },
+        id="replace_tag_on_issue",
+    ),
+    pytest.param(
+        "remove_all_tags_from_issue",
+        {"issue_id": "DEMO-123"},
+        {"remove_all_tags_from_issue": {"id": "DEMO-123", "tags": []}},
+        {"id": "DEMO-123", "tags": []},
+        {"remove_all_tags_from_issue": [call("DEMO-123")]},
+        id="remove_all_tags_from_issue",
+    ),
+    pytest.param(
+        "find_tag_by_name",
+        {"tag_name": "deploy"},
+        {"find_tag_by_name": _TAG_DEPLOY},
+        _TAG_DEPLOY,
+        {"find_tag_by_name": [call("deploy")]},
+        id="find_tag_by_name",
+    ),
+]
 
 
 class TestTags:
     """Test cases for tag management functionality."""
 
-    def setup_method(self):
-        """Set up test fixtures."""
-        self.mock_client = Mock()
-        self.issues_api = IssuesClient(self.mock_client)
-        self.projects_api = ProjectsClient(self.mock_client)
-        self.tags = Tags(self.issues_api, self.projects_api)
-
-    def test_get_available_tags_success(self):
-        """Test getting available tags successfully."""
-        # Mock API response
-        mock_tags = [
-            {"id": "6-1", "name": "deploy", "owner": {"id": "1-1", "login": "admin"}},
-            {"id": "6-2", "name": "urgent", "owner": {"id": "1-1", "login": "admin"}},
-            {"id": "6-3", "name": "bug", "owner": {"id": "1-2", "login": "user"}}
-        ]
-        self.issues_api.get_tags = Mock(return_value=mock_tags)
-        
-        result = self.tags.get_available_tags(query="deploy", limit=10)
-        result_data = json.loads(result)
-        
-        assert "error" not in result_data
-        assert len(result_data) == 3
-        assert result_data[0]["name"] == "deploy"
-        
-        # Verify API was called with correct parameters
-        self.issues_api.get_tags.assert_called_once_with(query="deploy", limit=10)
-
-    def test_get_available_tags_error(self):
-        """Test error handling when getting available tags fails."""
-        self.issues_api.get_tags = Mock(side_effect=Exception("API Error"))
-        
-        result = self.tags.get_available_tags()
-        result_data = json.loads(result)
-        
-        assert "error" in result_data
-        assert "API Error" in result_data["error"]
-
-    def test_get_issue_tags_success(self):
-        """Test getting tags for an issue successfully."""
-        mock_issue_tags = [
-            {"id": "6-1", "name": "deploy", "owner": {"id": "1-1", "login": "admin"}},
-            {"id": "6-2", "name": "urgent", "owner": {"id": "1-1", "login": "admin"}}
-        ]
-        self.issues_api.get_issue_tags = Mock(return_value=mock_issue_tags)
-        
-        result = self.tags.get_issue_tags("DEMO-123")
-        result_data = json.loads(result)
-        
-        assert "error" not in result_data
-        assert len(result_data) == 2
-        assert result_data[0]["name"] == "deploy"
-        
-        # Verify API was called with correct issue ID
-        self.issues_api.get_issue_tags.assert_called_once_with("DEMO-123")
-
-    def test_add_tag_to_issue_success(self):
-        """Test adding a tag to an issue successfully."""
-        mock_tag = {"id": "6-1", "name": "deploy", "owner": {"id": "1-1", "login": "admin"}}
-        mock_issue_result = {
-            "id": "DEMO-123",
-            "tags": [mock_tag]
-        }
-        
-        self.issues_api.find_tag_by_name = Mock(return_value=mock_tag)
-        self.issues_api.add_tag_to_issue = Mock(return_value=mock_issue_result)
-        
-        result = self.tags.add_tag_to_issue("DEMO-123", "deploy")
-        result_data = json.loads(result)
-        
-        assert "error" not in result_data
-        assert result_data["id"] == "DEMO-123"
-        assert len(result_data["tags"]) == 1
-        assert result_data["tags"][0]["name"] == "deploy"
-        
+    @pytest.mark.parametrize("method, kwargs, stubs, expected, calls", SUCCESS_CASES)
+    def test_success(self, tags, method, kwargs, stubs, expected, calls):
+        """Test each tag operation's success path on the pre-serialization result."""
+        for attr, return_value in stubs.items():
+            getattr(tags.issues_api, attr).return_value = return_value
+
+        result = getattr(tags, f"_raw_{method}")(**kwargs)
+
+        assert result == expected
+
         # Verify API calls
-        self.issues_api.find_tag_by_name.assert_called_once_with("deploy")
-        self.issues_api.add_tag_to_issue.assert_called_once_with("DEMO-123", "6-1")
+        for attr, expected_calls in calls.items():
+            assert getattr(tags.issues_api, attr).call_args_list == expected_calls
+
+    def test_get_available_tags_returns_json(self, tags):
+        """Test that the public tool serializes the raw result to JSON."""
+        tags.issues_api.get_tags.return_value = _MOCK_TAGS
+
+        result = tags.get_available_tags(query="deploy", limit=10)
+
+        assert json.loads(result) == _MOCK_TAGS
+
+    def test_get_available_tags_error(self, tags):
+        """Test error handling when getting available tags fails."""
+        tags.issues_api.get_tags.side_effect = Exception("API Error")
 
-    def test_add_tag_to_issue_tag_not_found(self):
+        result = tags._raw_get_available_tags()
+
+        assert "error" in result
+        assert "API Error" in result["error"]
+
+    def test_add_tag_to_issue_tag_not_found(self, tags):
         """Test adding a tag that doesn't exist."""
-        self.issues_api.find_tag_by_name = Mock(return_value=None)
-        
-        result = self.tags.add_tag_to_issue("DEMO-123", "nonexistent")
-        result_data = json.loads(result)
-        
-        assert "error" in result_data
-        assert "Tag 'nonexistent' not found" in result_data["error"]
-
-    def test_remove_tag_from_issue_success(self):
-        """Test removing a tag from an issue successfully."""
-        mock_tag = {"id": "6-1", "name": "deploy", "owner": {"id": "1-1", "login": "admin"}}
-        
-        self.issues_api.find_tag_by_name = Mock(return_value=mock_tag)
-        self.issues_api.remove_tag_from_issue = Mock(return_value=True)
-        
-        result = self.tags.remove_tag_from_issue("DEMO-123", "deploy")
-        result_data = json.loads(result)
-        
-        assert "error" not in result_data
-        assert result_data["success"] is True
-        assert "Tag 'deploy' removed" in result_data["message"]
-        
-        # Verify API calls
-        self.issues_api.find_tag_by_name.assert_called_once_with("deploy")
-        self.issues_api.remove_tag_from_issue.assert_called_once_with("DEMO-123", "6-1")
+        tags.issues_api.find_tag_by_name.return_value = None
+
+        result = tags._raw_add_tag_to_issue("DEMO-123", "nonexistent")
+
+        assert "error" in result
+        assert "Tag 'nonexistent' not found" in result["error"]
 
-    def test_remove_tag_from_issue_tag_not_found(self):
+    def test_remove_tag_from_issue_tag_not_found(self, tags):
         """Test removing a tag that doesn't exist on the issue."""
-        self.issues_api.find_tag_by_name = Mock(return_value=None)
-        
-        result = self.tags.remove_tag_from_issue("DEMO-123", "nonexistent")
-        result_data = json.loads(result)
-        
-        assert "error" in result_data
-        assert "Tag 'nonexistent' not found" in result_data["error"]
-
-    def test_set_issue_tags_success(self):
+        tags.issues_api.find_tag_by_name.return_value = None
+
+        result = tags._raw_remove_tag_from_issue("DEMO-123", "nonexistent")
+
+        assert "error" in result
+        assert "Tag 'nonexistent' not found" in result["error"]
+
+    def test_set_issue_tags_success(self, tags):
         """Test setting all tags for an issue successfully."""
-        mock_tags = [
-            {"id": "6-1", "name": "deploy"},
-            {"id": "6-2", "name": "urgent"}
-        ]
         mock_issue_result = {
             "id": "DEMO-123",
-            "tags": mock_tags
+            "tags": _MOCK_ISSUE_TAGS
         }
-        
-        self.issues_api.find_tag_by_name = Mock(side_effect=[
-            {"id": "6-1", "name": "deploy"},
-            {"id": "6-2", "name": "urgent"}
-        ])
-        self.issues_api.set_issue_tags = Mock(return_value=mock_issue_result)
-        
-        result = self.tags.set_issue_tags("DEMO-123", ["deploy", "urgent"])
-        result_data = json.loads(result)
-        
-        assert "error" not in result_data
-        assert result_data["id"] == "DEMO-123"
-        assert len(result_data["tags"]) == 2
-        
-        # Verify API calls
-        assert self.issues_api.find_tag_by_name.call_count == 2
-        self.issues_api.set_issue_tags.assert_called_once_with("DEMO-123", ["6-1", "6-2"])
 
-    def test_set_issue_tags_missing_tags(self):
+        tags.issues_api.find_tags_by_names.return_value = {"deploy": _TAG_DEPLOY, "urgent": _TAG_URGENT}
+        tags.issues_api.set_issue_tags.return_value = mock_issue_result
+
+        result = tags._raw_set_issue_tags("DEMO-123", ["deploy", "Urgent"])
+
+        assert "error" not in result
+        assert result["id"] == "DEMO-123"
+        assert len(result["tags"]) == 2
+
+        # Verify API calls: one batch lookup, no per-tag lookups
+        tags.issues_api.find_tags_by_names.assert_called_once_with(["deploy", "Urgent"])
+        tags.issues_api.find_tag_by_name.assert_not_called()
+        tags.issues_api.set_issue_tags.assert_called_once_with("DEMO-123", ["6-1", "6-2"])
+
+    def test_set_issue_tags_missing_tags(self, tags):
         """Test setting tags when some tags don't exist."""
-        self.issues_api.find_tag_by_name = Mock(side_effect=[
-            {"id": "6-1", "name": "deploy"},
-            None  # Second tag not found
-        ])
-        
-        result = self.tags.set_issue_tags("DEMO-123", ["deploy", "nonexistent"])
-        result_data = json.loads(result)
-        
-        assert "error" in result_data
-        assert "Tags not found: nonexistent" in result_data["error"]
-
-    def test_remove_all_tags_from_issue_success(self):
-        """Test removing all tags from an issue successfully."""
-        mock_issue_result = {
-            "id": "DEMO-123",
-            "tags": []
-        }
-        
-        self.issues_api.remove_all_tags_from_issue = Mock(return_value=mock_issue_result)
-        
-        result = self.tags.remove_all_tags_from_issue("DEMO-123")
-        result_data = json.loads(result)
-        
-        assert "error" not in result_data
-        assert result_data["id"] == "DEMO-123"
-        assert len(result_data["tags"]) == 0
-        
-        # Verify API call
-        self.issues_api.remove_all_tags_from_issue.assert_called_once_with("DEMO-123")
-
-    def test_find_tag_by_name_success(self):
-        """Test finding a tag by name successfully."""
-        mock_tag = {"id": "6-1", "name": "deploy", "owner": {"id": "1-1", "login": "admin"}}
-        
-        self.issues_api.find_tag_by_name = Mock(return_value=mock_tag)
-        
-        result = self.tags.find_tag_by_name("deploy")
-        result_data = json.loads(result)
-        
-        assert "error" not in result_data
-        assert result_data["name"] == "deploy"
-        assert result_data["id"] == "6-1"
-        
-        # Verify API call
-        self.issues_api.find_tag_by_name.assert_called_once_with("deploy")
-
-    def test_find_tag_by_name_not_found(self):
+        # Second tag not found by either lookup
+        tags.issues_api.find_tags_by_names.return_value = {"deploy": _TAG_DEPLOY}
+        tags.issues_api.find_tag_by_name.return_value = None
+
+        result = tags._raw_set_issue_tags("DEMO-123", ["deploy", "nonexistent"])
+
+        assert "error" in result
+        assert "Tags not found: nonexistent" in result["error"]
+        tags.issues_api.set_issue_tags.assert_not_called()
+        tags.issues_api.find_tag_by_name.assert_called_once_with("nonexistent")
+
+    def test_set_issue_tags_resolves_names_missed_by_batch(self, tags):
+        """Test that names outside the batch lookup are found individually."""
+        tags.issues_api.find_tags_by_names.return_value = {"deploy": _TAG_DEPLOY}
+        tags.issues_api.find_tag_by_name.side_effect = lambda name: {"urgent": _TAG_URGENT, "bug": _TAG_BUG}[name]
+        tags.issues_api.set_issue_tags.return_value = {"id": "DEMO-123"}
+
+        result = tags._raw_set_issue_tags("DEMO-123", ["deploy", "Urgent", "bug", "urgent"])
+
+        assert result == {"id": "DEMO-123"}
+        assert sorted(c.args[0] for c in tags.issues_api.find_tag_by_name.call_args_list) == ["bug", "urgent"]
+        tags.issues_api.set_issue_tags.assert_called_once_with("DEMO-123", ["6-1", "6-2", "6-3", "6-2"])
+
+    def test_replace_tag_on_issue_old_tag_not_on_issue(self, tags):
+        """Test replacing a tag the issue does not have."""
+        tags.issues_api.get_issue_tags.return_value = [_TAG_URGENT]
+
+        result = tags._raw_replace_tag_on_issue("DEMO-123", "deploy", "bug")
+
+        assert "Tag 'deploy' not found on this issue" in result["error"]
+        tags.issues_api.set_issue_tags.assert_not_called()
+
+    def test_replace_tag_on_issue_new_tag_not_found(self, tags):
+        """Test replacing a tag with one that doesn't exist."""
+        tags.issues_api.get_issue_tags.return_value = _MOCK_ISSUE_TAGS
+        tags.issues_api.find_tag_by_name.return_value = None
+
+        result = tags._raw_replace_tag_on_issue("DEMO-123", "deploy", "nonexistent")
+
+        assert "Tag 'nonexistent' not found" in result["error"]
+        tags.issues_api.set_issue_tags.assert_not_called()
+
+    def test_replace_tag_on_issue_new_tag_already_present(self, tags):
+        """Test that the new tag is not duplicated when already on the issue."""
+        tags.issues_api.get_issue_tags.return_value = _MOCK_ISSUE_TAGS
+        tags.issues_api.find_tag_by_name.return_value = _TAG_URGENT
+        tags.issues_api.set_issue_tags.return_value = {"id": "DEMO-123", "tags": [_TAG_URGENT]}
+
+        tags._raw_replace_tag_on_issue("DEMO-123", "deploy", "urgent")
+
+        tags.issues_api.set_issue_tags.assert_called_once_with("DEMO-123", ["6-2"])
+
+    def test_find_tag_by_name_not_found(self, tags):
         """Test finding a tag that doesn't exist."""
-        self.issues_api.find_tag_by_name = Mock(return_value=None)
-        
-        result = self.tags.find_tag_by_name("nonexistent")
-        result_data = json.loads(result)
-        
-        assert "error" in result_data
-        assert "Tag 'nonexistent' not found" in result_data["error"]
-
-    def test_get_tool_definitions(self):
+        tags.issues_api.find_tag_by_name.return_value = None
+
+        result = tags._raw_find_tag_by_name("nonexistent")
+
+        assert "error" in result
+        assert "Tag 'nonexistent' not found" in result["error"]
+
+    def test_tag_lookup_is_cached(self, tags):
+        """Test that repeated lookups of a tag name hit the API once."""
+        tags.issues_api.find_tag_by_name.return_value = _TAG_DEPLOY
+        tags.issues_api.add_tag_to_issue.return_value = {"id": "DEMO-123"}
+        tags.issues_api.remove_tag_from_issue.return_value = True
+
+        tags._raw_add_tag_to_issue("DEMO-123", "deploy")
+        tags._raw_remove_tag_from_issue("DEMO-123", "Deploy")
+        tags._raw_find_tag_by_name("DEPLOY")
+
+        tags.issues_api.find_tag_by_name.assert_called_once_with("deploy")
+
+    def test_find_tag_by_name_does_not_expose_cached_tag(self, tags):
+        """Test that formatting a found tag leaves the cached tag untouched."""
+        cached = {"id": "6-4", "name": "release", "created": 1672531200000}
+        tags.issues_api.find_tag_by_name.return_value = cached
+
+        result = json.loads(tags.find_tag_by_name("release"))
+
+        assert result["created_iso8601"] == "2023-01-01T00:00:00+00:00"
+        assert "created_iso8601" not in cached
+        assert tags._raw_find_tag_by_name("release") is not cached
+
+    def test_tag_lookup_misses_not_cached(self, tags):
+        """Test that a missing tag is looked up again on the next call."""
+        tags.issues_api.find_tag_by_name.side_effect = [None, _TAG_DEPLOY]
+
+        assert "error" in tags._raw_find_tag_by_name("deploy")
+        assert tags._raw_find_tag_by_name("deploy") == _TAG_DEPLOY
+        assert tags.issues_api.find_tag_by_name.call_count == 2
+
+    def test_tag_cache_cleared_after_remove_all(self, tags):
+        """Test that removing all tags invalidates the tag cache."""
+        tags.issues_api.find_tag_by_name.return_value = _TAG_DEPLOY
+        tags.issues_api.remove_all_tags_from_issue.return_value = {"id": "DEMO-123", "tags": []}
+
+        tags._raw_find_tag_by_name("deploy")
+        tags._raw_remove_all_tags_from_issue("DEMO-123")
+        tags._raw_find_tag_by_name("deploy")
+
+        assert tags.issues_api.find_tag_by_name.call_count == 2
+
+    def test_get_tool_definitions(self, tags):
         """Test that tool definitions are properly structured."""
-        definitions = self.tags.get_tool_definitions()
-        
+        definitions = tags.get_tool_definitions()
+
         # Check that all expected tools are defined
         expected_tools = [
             "get_available_tags",
-            "get_issue_tags", 
+            "get_issue_tags",
             "add_tag_to_issue",
             "remove_tag_from_issue",
             "set_issue_tags",
+            "replace_tag_on_issue",
             "remove_all_tags_from_issue",
             "find_tag_by_name"
         ]
-        
+
         for tool_name in expected_tools:
             assert tool_name in definitions
             assert "description" in definitions[tool_name]
             assert "parameter_descriptions" in definitions[tool_name]
+
+    def test_get_tool_definitions_built_once_per_instance(self, tags):
+        """Test that tool definitions are cached on the instance."""
+        other = Tags(tags.issues_api, tags.projects_api)
+
+        assert tags.tool_definitions is tags.tool_definitions
+        assert other.tool_definitions is not tags.tool_definitions
+        assert other.get_tool_definitions() == tags.get_tool_definitions()
+
+    def test_get_tool_definitions_mutation_does_not_leak_into_cache(self, tags):
+        """Test that annotating returned definitions leaves the cache untouched."""
+        definitions = tags.get_tool_definitions()
+        definitions["set_issue_tags"]["source_class"] = "IssueTools"
+
+        assert "source_class" not in tags.tool_definitions["set_issue_tags"]
+        assert "source_class" not in tags.get_tool_definitions()["set_issue_tags"]
+
+    def test_utilities_reuses_tags_instance(self, tags):
+        """Test that consolidating definitions twice builds Tags only once."""
+        utilities = Utilities(tags.issues_api, tags.projects_api)
+
+        with patch("youtrack_mcp.tools.issues.tags.Tags", wraps=Tags) as mock_tags_class:
+            first = utilities.get_tool_definitions()
+            second = utilities.get_tool_definitions()
+
+        mock_tags_class.assert_called_once_with(tags.issues_api, tags.projects_api)
+        assert first["set_issue_tags"] == second["set_issue_tags"]
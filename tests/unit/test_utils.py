@@ -4,8 +4,13 @@ Tests for youtrack_mcp/utils.py
 
 import json
 import pytest
+from collections import OrderedDict
 from datetime import datetime, timezone
+from unittest.mock import patch
+
+import orjson
 from youtrack_mcp.utils import (
+    _timestamp_to_iso8601,
     convert_timestamp_to_iso8601,
     add_iso8601_timestamps,
     format_json_response
@@ -55,6 +60,30 @@ class TestConvertTimestampToIso8601:
         # Should either return valid ISO string or fallback to string representation
         assert isinstance(result, str)
 
+    @pytest.mark.parametrize("timestamp_ms", [1672531200500, 1672531200001, -1, 253402300799999])
+    def test_fractional_seconds_match_isoformat(self, timestamp_ms):
+        """Test that millisecond timestamps match datetime.isoformat() output."""
+        seconds, millis = divmod(timestamp_ms, 1000)
+        expected = datetime.fromtimestamp(seconds, tz=timezone.utc).replace(
+            microsecond=millis * 1000
+        ).isoformat()
+
+        assert convert_timestamp_to_iso8601(timestamp_ms) == expected
+
+    def test_year_out_of_range_returns_string(self):
+        """Test that timestamps past year 9999 fall back to the raw value."""
+        assert convert_timestamp_to_iso8601(253402300800000) == "253402300800000"
+
+    def test_repeated_timestamp_is_memoized(self):
+        """Test that converting the same timestamp again hits the cache."""
+        _timestamp_to_iso8601.cache_clear()
+
+        first = convert_timestamp_to_iso8601(1672531200000)
+        second = convert_timestamp_to_iso8601(1672531200000)
+
+        assert first == second == "2023-01-01T00:00:00+00:00"
+        assert _timestamp_to_iso8601.cache_info().hits == 1
+
 
 class TestAddIso8601Timestamps:
     """Test add_iso8601_timestamps function."""
@@ -101,6 +130,15 @@ class TestAddIso8601Timestamps:
         assert result["created"] == "not-a-number"
         assert result["updated"] is None
 
+    def test_dict_with_boolean_timestamp(self):
+        """Test that boolean values are not treated as timestamps."""
+        data = {"created": True, "updated": False}
+        result = add_iso8601_timestamps(data)
+
+        assert "created_iso8601" not in result
+        assert "updated_iso8601" not in result
+        assert json.loads(format_json_response(data)) == data
+
     def test_nested_dict_with_timestamps(self):
         """Test nested dictionaries with timestamps."""
         data = {
@@ -184,6 +222,39 @@ class TestAddIso8601Timestamps:
         # Result should have ISO8601 field
         assert "created_iso8601" in result
 
+    def test_flat_dict_without_timestamps_returns_copy(self):
+        """Test that a flat dict without timestamps comes back as an equal copy."""
+        data = {"error": "Tag 'deploy' not found", "code": 404}
+
+        result = add_iso8601_timestamps(data)
+
+        assert result == data
+        assert result is not data
+
+    def test_inplace_mutates_input(self):
+        """Test that _inplace adds the fields to the input without copying."""
+        nested = {"updated": 1672531200000}
+        data = {"created": 1672531200000, "items": [nested]}
+
+        result = add_iso8601_timestamps(data, _inplace=True)
+
+        assert result is data
+        assert result["items"][0] is nested
+        assert nested["updated_iso8601"] == "2023-01-01T00:00:00+00:00"
+
+    def test_nesting_deeper_than_recursion_limit(self):
+        """Test that very deep nesting is handled without recursion."""
+        data = leaf = {"created": 1672531200000}
+        for _ in range(5000):
+            data = {"children": [data]}
+
+        result = add_iso8601_timestamps(data)
+
+        for _ in range(5000):
+            result = result["children"][0]
+        assert result["created_iso8601"] == "2023-01-01T00:00:00+00:00"
+        assert "created_iso8601" not in leaf
+
 
 class TestFormatJsonResponse:
     """Test format_json_response function."""
@@ -260,4 +331,61 @@ class TestFormatJsonResponse:
         
         # Should be indented (contains newlines and spaces)
         assert "\n" in result
-        assert "  " in result  # 2-space indentation 
\ No newline at end of file
+        assert "  " in result  # 2-space indentation 
+
+    def test_orjson_output_matches_json_dumps(self):
+        """Test that orjson output parses to the same ordered data as json.dumps."""
+        data = {
+            "id": "2-1",
+            "tags": [{"name": "ünïcode", "created": 1672531200000}],
+            "flags": {1: True, None: False},
+        }
+
+        result = format_json_response(data)
+
+        expected = json.dumps(add_iso8601_timestamps(data), indent=2)
+        assert list(json.loads(result)["tags"][0]) == ["name", "created", "created_iso8601"]
+        assert json.loads(result) == json.loads(expected)
+        assert "ünïcode" in result
+
+    def test_orjson_rejected_payload_falls_back(self):
+        """Test that integers beyond 64 bits still serialize."""
+        result = format_json_response({"big": 2**70})
+
+        assert result == json.dumps({"big": 2**70}, indent=2)
+
+    def test_orjson_and_fallback_paths_agree(self):
+        """Test that the orjson and json.dumps paths add the same timestamp fields."""
+        def payload():
+            return {
+                "id": "2-1",
+                "created": 1672531200000,
+                "created_iso8601": "stale",
+                "pair": ({"created": 1672531200000}, 1),
+                "ordered": OrderedDict(updated=1672531200500),
+                "items": [{"updated": 1672531200500}, [], {}],
+                "flags": {1: True, None: False, 2.5: None},
+            }
+
+        primary = format_json_response(payload())
+        with patch("youtrack_mcp.utils.orjson.dumps", side_effect=orjson.JSONEncodeError):
+            fallback = format_json_response(payload())
+
+        assert fallback == json.dumps(add_iso8601_timestamps(payload()), indent=2)
+        assert json.loads(primary) == json.loads(fallback)
+        assert list(json.loads(primary)) == list(json.loads(fallback))
+
+    def test_unserializable_value_raises(self):
+        """Test that non-JSON values raise TypeError like json.dumps."""
+        with pytest.raises(TypeError, match="not JSON serializable"):
+            format_json_response({"value": object()})
+
+    def test_flat_payload_skips_timestamp_walk(self):
+        """Test that flat dicts without timestamps are serialized directly."""
+        data = {"success": True, "message": "Tag 'deploy' removed from issue DEMO-123"}
+
+        with patch("youtrack_mcp.utils.add_iso8601_timestamps") as mock_add:
+            result = format_json_response(data)
+
+        mock_add.assert_not_called()
+        assert json.loads(result) == data
@@ -4,18 +4,24 @@ These tests cover all available functions with edge cases and error scenarios.
 """
 
 import pytest
-from datetime import datetime, timezone
+from datetime import datetime
 from typing import Dict, List, Any
 from unittest.mock import patch
 from unittest import mock
 import os
 
+from youtrack_mcp import utils
 from youtrack_mcp.utils import convert_timestamp_to_iso8601, add_iso8601_timestamps
 
 
 class TestConvertTimestampToIso8601:
     """Comprehensive tests for convert_timestamp_to_iso8601 function."""
 
+    @pytest.fixture(autouse=True)
+    def clear_conversion_cache(self):
+        """Drop memoized conversions so patched gmtime errors are hit."""
+        utils._timestamp_to_iso8601.cache_clear()
+
     @pytest.mark.unit
     def test_convert_valid_timestamps(self):
         """Test convert_timestamp_to_iso8601 with valid timestamps."""
@@ -66,9 +72,8 @@ class TestConvertTimestampToIso8601:
     def test_convert_error_handling(self):
         """Test error handling in convert_timestamp_to_iso8601."""
         # Test with timestamp that causes ValueError
-        with patch('youtrack_mcp.utils.datetime') as mock_datetime:
-            mock_datetime.fromtimestamp.side_effect = ValueError("Invalid timestamp")
-            mock_datetime.timezone = timezone
+        with patch('youtrack_mcp.utils.time') as mock_time:
+            mock_time.gmtime.side_effect = ValueError("Invalid timestamp")
             
             result = convert_timestamp_to_iso8601(1234567890)
             
@@ -79,9 +84,8 @@ class TestConvertTimestampToIso8601:
     def test_convert_overflow_error(self):
         """Test overflow error handling in convert_timestamp_to_iso8601."""
         # Test with timestamp that causes OverflowError
-        with patch('youtrack_mcp.utils.datetime') as mock_datetime:
-            mock_datetime.fromtimestamp.side_effect = OverflowError("Timestamp overflow")
-            mock_datetime.timezone = timezone
+        with patch('youtrack_mcp.utils.time') as mock_time:
+            mock_time.gmtime.side_effect = OverflowError("Timestamp overflow")
             
             result = convert_timestamp_to_iso8601(999999999999999999)
             
@@ -92,9 +96,8 @@ class TestConvertTimestampToIso8601:
     def test_convert_os_error(self):
         """Test OS error handling in convert_timestamp_to_iso8601."""
         # Test with timestamp that causes OSError
-        with patch('youtrack_mcp.utils.datetime') as mock_datetime:
-            mock_datetime.fromtimestamp.side_effect = OSError("System error")
-            mock_datetime.timezone = timezone
+        with patch('youtrack_mcp.utils.time') as mock_time:
+            mock_time.gmtime.side_effect = OSError("System error")
             
             result = convert_timestamp_to_iso8601(1672531200000)
             
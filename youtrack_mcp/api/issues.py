@@ -2834,6 +2834,38 @@ class IssuesClient:
         
         return field_type
 
+    # === Command Methods ===
+
+    def apply_commands(
+        self, issue_id: str, command: str, fields: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """
+        Apply a YouTrack command to an issue in a single request.
+
+        Several changes can be combined into one command string, e.g.
+        "Type {Bug} Priority {Critical} tag test", instead of issuing a
+        separate update call for each of them.
+
+        Args:
+            issue_id: The issue ID (readable or internal)
+            command: Command text, as typed in the YouTrack command dialog
+            fields: Optional fields to return for the affected issues, e.g.
+                "id,idReadable,summary". Saves a follow-up get_issue call.
+
+        Returns:
+            The Commands API response; includes an "issues" list when
+            fields are requested
+        """
+        readable_id = self._get_readable_id(issue_id)
+        command_data = {
+            "query": command,
+            "issues": [{"idReadable": readable_id}],
+        }
+        endpoint = "commands"
+        if fields:
+            endpoint = f"commands?fields=issues({fields})"
+        return self.client.post(endpoint, data=command_data)
+
     # === Tag Management Methods ===
 
     def get_tags(self, query: Optional[str] = None, limit: int = 50) -> List[Dict[str, Any]]:
@@ -2950,3 +2982,24 @@ class IssuesClient:
             if tag.get("name", "").lower() == tag_name.lower():
                 return tag
         return None
+
+    def find_tags_by_names(self, tag_names: List[str], limit: int = 500) -> Dict[str, Dict[str, Any]]:
+        """
+        Resolve several tag names with a single tags request.
+        
+        Args:
+            tag_names: Names of the tags to resolve
+            limit: Maximum number of tags to fetch (raised to len(tag_names) if smaller)
+            
+        Returns:
+            Mapping of lowercased tag name to tag object for every name that was found
+        """
+        wanted = {name.lower() for name in tag_names}
+        if not wanted:
+            return {}
+        tags = self.get_tags(limit=max(limit, len(wanted)))
+        return {
+            tag.get("name", "").lower(): tag
+            for tag in tags
+            if tag.get("name", "").lower() in wanted
+        }
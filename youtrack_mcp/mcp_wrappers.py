@@ -13,6 +13,26 @@ from typing import Any, Callable, Dict, Optional, Tuple, Union
 
 logger = logging.getLogger(__name__)
 
+# Parameter names that process_parameters unpacks or normalize_parameter_names
+# may rename; calls using none of them are passed through unchanged. Keep in
+# sync with those functions.
+_PROCESSED_PARAMETER_NAMES = frozenset(
+    {
+        "args",
+        "kwargs",
+        "project",
+        "project_id",
+        "project_key",
+        "issue_key",
+        "user",
+        "user_id",
+        "user_login",
+        "custom_field_id",
+        "query",
+        "filters",
+    }
+)
+
 
 def sync_wrapper(func: Callable) -> Callable:
     """
@@ -31,25 +51,32 @@ def sync_wrapper(func: Callable) -> Callable:
         Wrapped function that handles parameter extraction
     """
 
+    # Get the original bound instance if this is a method
+    instance = getattr(func, "__self__", None)
+
     @wraps(func)
     def wrapper(*args, **kwargs):
-        # Log the original parameters for debugging
-        logger.debug(
-            f"Original parameters for {func.__name__}: args={args}, kwargs={kwargs}"
-        )
-
-        # Process the parameters to get the correct format
-        processed_args, processed_kwargs = process_parameters(
-            func.__name__, args, kwargs
-        )
+        debug = logger.isEnabledFor(logging.DEBUG)
+        if debug:
+            # Log the original parameters for debugging
+            logger.debug(
+                f"Original parameters for {func.__name__}: args={args}, kwargs={kwargs}"
+            )
 
-        # Get the original bound instance if this is a method
-        instance = getattr(func, "__self__", None)
+        if _PROCESSED_PARAMETER_NAMES.isdisjoint(kwargs):
+            # Plain named parameters: nothing to unpack or rename
+            processed_args, processed_kwargs = args, kwargs
+        else:
+            # Process the parameters to get the correct format
+            processed_args, processed_kwargs = process_parameters(
+                func.__name__, args, kwargs
+            )
 
-        # Log the processed parameters for debugging
-        logger.debug(
-            f"Calling {func.__name__} with processed args: {processed_args}, kwargs: {processed_kwargs}"
-        )
+        if debug:
+            # Log the processed parameters for debugging
+            logger.debug(
+                f"Calling {func.__name__} with processed args: {processed_args}, kwargs: {processed_kwargs}"
+            )
 
         # Call the original function with the processed parameters
         try:
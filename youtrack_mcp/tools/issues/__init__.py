@@ -205,6 +205,10 @@ class IssueTools:
         """Set all tags for an issue (replaces existing tags)."""
         return self.tags.set_issue_tags(issue_id, tag_names)
     
+    def replace_tag_on_issue(self, issue_id: str, old_tag_name: str, new_tag_name: str) -> str:
+        """Replace one tag on an issue with another in a single update."""
+        return self.tags.replace_tag_on_issue(issue_id, old_tag_name, new_tag_name)
+    
     def remove_all_tags_from_issue(self, issue_id: str) -> str:
         """Remove all tags from an issue."""
         return self.tags.remove_all_tags_from_issue(issue_id)
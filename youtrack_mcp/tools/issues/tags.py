@@ -7,12 +7,16 @@ This module provides MCP tools for managing tags on YouTrack issues:
 - Add tags to issues
 - Remove tags from issues
 - Set all tags for an issue
+- Replace one tag with another on an issue
 - Find tags by name
 
 These tools integrate with the YouTrack REST API tag endpoints.
 """
 
+import copy
+import functools
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from typing import Any, Dict, List, Optional
 
 from youtrack_mcp.api.issues import IssuesClient
@@ -23,6 +27,10 @@ from youtrack_mcp.utils import format_json_response, create_enhanced_tool_descri
 logger = logging.getLogger(__name__)
 
 
+class _TagNotFound(LookupError):
+    """Raised by the tag resolver so that misses are not memoized."""
+
+
 class Tags:
     """
     YouTrack issue tags management tools.
@@ -36,6 +44,25 @@ class Tags:
         self.issues_api = issues_api
         self.projects_api = projects_api
         self.client = issues_api.client
+        # Tag definitions rarely change within a session, so resolved tags are
+        # memoized per instance, keyed by lowercased name
+        self._tag_cache = functools.lru_cache(maxsize=512)(self._resolve_tag)
+
+    def _resolve_tag(self, name_lower: str) -> Dict[str, Any]:
+        """Look up a tag by lowercased name, raising _TagNotFound on a miss."""
+        tag = self.issues_api.find_tag_by_name(name_lower)
+        if not tag:
+            raise _TagNotFound(name_lower)
+        return tag
+
+    def _lookup_tag(self, tag_name: str) -> Optional[Dict[str, Any]]:
+        """Return a copy of the cached tag for a name, or None if it does not exist."""
+        try:
+            tag = self._tag_cache(tag_name.lower())
+        except _TagNotFound:
+            return None
+        # Callers may hand the tag to format_json_response, which edits in place
+        return copy.deepcopy(tag)
 
     @sync_wrapper
     def get_available_tags(self, query: Optional[str] = None, limit: int = 50) -> str:
@@ -51,12 +78,15 @@ class Tags:
         Returns:
             JSON string with available tags
         """
+        return format_json_response(self._raw_get_available_tags(query=query, limit=limit))
+
+    def _raw_get_available_tags(self, query: Optional[str] = None, limit: int = 50) -> Any:
+        """Get available tags (or an error dict) before JSON serialization."""
         try:
-            tags = self.issues_api.get_tags(query=query, limit=limit)
-            return format_json_response(tags)
+            return self.issues_api.get_tags(query=query, limit=limit)
         except Exception as e:
             logger.exception(f"Error getting available tags")
-            return format_json_response({"error": str(e)})
+            return {"error": str(e)}
 
     @sync_wrapper
     def get_issue_tags(self, issue_id: str) -> str:
@@ -71,12 +101,15 @@ class Tags:
         Returns:
             JSON string with tags assigned to the issue
         """
+        return format_json_response(self._raw_get_issue_tags(issue_id))
+
+    def _raw_get_issue_tags(self, issue_id: str) -> Any:
+        """Get the issue's tags (or an error dict) before JSON serialization."""
         try:
-            tags = self.issues_api.get_issue_tags(issue_id)
-            return format_json_response(tags)
+            return self.issues_api.get_issue_tags(issue_id)
         except Exception as e:
             logger.exception(f"Error getting tags for issue {issue_id}")
-            return format_json_response({"error": str(e)})
+            return {"error": str(e)}
 
     @sync_wrapper
     def add_tag_to_issue(self, issue_id: str, tag_name: str) -> str:
@@ -92,20 +125,23 @@ class Tags:
         Returns:
             JSON string with updated issue data including tags
         """
+        return format_json_response(self._raw_add_tag_to_issue(issue_id, tag_name))
+
+    def _raw_add_tag_to_issue(self, issue_id: str, tag_name: str) -> Any:
+        """Add a tag and return the updated issue (or an error dict) before JSON serialization."""
         try:
             # First, find the tag by name to get its ID
-            tag = self.issues_api.find_tag_by_name(tag_name)
+            tag = self._lookup_tag(tag_name)
             if not tag:
-                return format_json_response({
+                return {
                     "error": f"Tag '{tag_name}' not found. Use get_available_tags() to see available tags."
-                })
+                }
             
             # Add the tag to the issue
-            result = self.issues_api.add_tag_to_issue(issue_id, tag["id"])
-            return format_json_response(result)
+            return self.issues_api.add_tag_to_issue(issue_id, tag["id"])
         except Exception as e:
             logger.exception(f"Error adding tag '{tag_name}' to issue {issue_id}")
-            return format_json_response({"error": str(e)})
+            return {"error": str(e)}
 
     @sync_wrapper
     def remove_tag_from_issue(self, issue_id: str, tag_name: str) -> str:
@@ -121,23 +157,27 @@ class Tags:
         Returns:
             JSON string with success status
         """
+        return format_json_response(self._raw_remove_tag_from_issue(issue_id, tag_name))
+
+    def _raw_remove_tag_from_issue(self, issue_id: str, tag_name: str) -> Dict[str, Any]:
+        """Remove a tag and return the status dict before JSON serialization."""
         try:
             # First, find the tag by name to get its ID
-            tag = self.issues_api.find_tag_by_name(tag_name)
+            tag = self._lookup_tag(tag_name)
             if not tag:
-                return format_json_response({
+                return {
                     "error": f"Tag '{tag_name}' not found on this issue."
-                })
+                }
             
             # Remove the tag from the issue
             success = self.issues_api.remove_tag_from_issue(issue_id, tag["id"])
             if success:
-                return format_json_response({"success": True, "message": f"Tag '{tag_name}' removed from issue {issue_id}"})
+                return {"success": True, "message": f"Tag '{tag_name}' removed from issue {issue_id}"}
             else:
-                return format_json_response({"error": f"Failed to remove tag '{tag_name}' from issue {issue_id}"})
+                return {"error": f"Failed to remove tag '{tag_name}' from issue {issue_id}"}
         except Exception as e:
             logger.exception(f"Error removing tag '{tag_name}' from issue {issue_id}")
-            return format_json_response({"error": str(e)})
+            return {"error": str(e)}
 
     @sync_wrapper
     def set_issue_tags(self, issue_id: str, tag_names: List[str]) -> str:
@@ -153,29 +193,78 @@ class Tags:
         Returns:
             JSON string with updated issue data including tags
         """
+        return format_json_response(self._raw_set_issue_tags(issue_id, tag_names))
+
+    def _raw_set_issue_tags(self, issue_id: str, tag_names: List[str]) -> Any:
+        """Set tags and return the updated issue (or an error dict) before JSON serialization."""
         try:
-            # Find all tag IDs by name
-            tag_ids = []
-            missing_tags = []
+            # Resolve all tag IDs by name with a single request
+            tag_map = self.issues_api.find_tags_by_names(tag_names)
             
-            for tag_name in tag_names:
-                tag = self.issues_api.find_tag_by_name(tag_name)
-                if tag:
-                    tag_ids.append(tag["id"])
-                else:
-                    missing_tags.append(tag_name)
+            # The batch lookup only sees one page of tags; look up any names it
+            # missed individually, in parallel rather than one after another
+            unresolved = list(dict.fromkeys(name.lower() for name in tag_names if name.lower() not in tag_map))
+            if unresolved:
+                with ThreadPoolExecutor(max_workers=min(8, len(unresolved))) as executor:
+                    for name, tag in zip(unresolved, executor.map(self._lookup_tag, unresolved)):
+                        if tag:
+                            tag_map[name] = tag
+            tag_ids = [tag_map[name.lower()]["id"] for name in tag_names if name.lower() in tag_map]
+            missing_tags = [name for name in tag_names if name.lower() not in tag_map]
             
             if missing_tags:
-                return format_json_response({
+                return {
                     "error": f"Tags not found: {', '.join(missing_tags)}. Use get_available_tags() to see available tags."
-                })
+                }
             
             # Set the tags on the issue
             result = self.issues_api.set_issue_tags(issue_id, tag_ids)
-            return format_json_response(result)
+            self._tag_cache.cache_clear()
+            return result
         except Exception as e:
             logger.exception(f"Error setting tags for issue {issue_id}")
-            return format_json_response({"error": str(e)})
+            return {"error": str(e)}
+
+    @sync_wrapper
+    def replace_tag_on_issue(self, issue_id: str, old_tag_name: str, new_tag_name: str) -> str:
+        """
+        Replace one tag on an issue with another in a single update.
+        
+        FORMAT: replace_tag_on_issue(issue_id="DEMO-123", old_tag_name="in-review", new_tag_name="approved")
+        
+        Args:
+            issue_id: Issue identifier like 'DEMO-123' or 'PROJECT-456'
+            old_tag_name: Name of the tag currently on the issue
+            new_tag_name: Name of the tag to put in its place
+            
+        Returns:
+            JSON string with updated issue data including tags
+        """
+        return format_json_response(self._raw_replace_tag_on_issue(issue_id, old_tag_name, new_tag_name))
+
+    def _raw_replace_tag_on_issue(self, issue_id: str, old_tag_name: str, new_tag_name: str) -> Any:
+        """Swap a tag and return the updated issue (or an error dict) before JSON serialization."""
+        try:
+            # The issue's current tags carry their IDs, so only the new tag needs resolving
+            current_tags = self.issues_api.get_issue_tags(issue_id)
+            old_lower = old_tag_name.lower()
+            if not any(tag.get("name", "").lower() == old_lower for tag in current_tags):
+                return {"error": f"Tag '{old_tag_name}' not found on this issue."}
+            
+            new_tag = self._lookup_tag(new_tag_name)
+            if not new_tag:
+                return {
+                    "error": f"Tag '{new_tag_name}' not found. Use get_available_tags() to see available tags."
+                }
+            
+            # Keep every other tag and set the result in one update
+            tag_ids = [tag["id"] for tag in current_tags if tag.get("name", "").lower() != old_lower]
+            if new_tag["id"] not in tag_ids:
+                tag_ids.append(new_tag["id"])
+            return self.issues_api.set_issue_tags(issue_id, tag_ids)
+        except Exception as e:
+            logger.exception(f"Error replacing tag '{old_tag_name}' with '{new_tag_name}' on issue {issue_id}")
+            return {"error": str(e)}
 
     @sync_wrapper
     def remove_all_tags_from_issue(self, issue_id: str) -> str:
@@ -190,12 +279,17 @@ class Tags:
         Returns:
             JSON string with updated issue data (empty tags)
         """
+        return format_json_response(self._raw_remove_all_tags_from_issue(issue_id))
+
+    def _raw_remove_all_tags_from_issue(self, issue_id: str) -> Any:
+        """Remove all tags and return the updated issue (or an error dict) before JSON serialization."""
         try:
             result = self.issues_api.remove_all_tags_from_issue(issue_id)
-            return format_json_response(result)
+            self._tag_cache.cache_clear()
+            return result
         except Exception as e:
             logger.exception(f"Error removing all tags from issue {issue_id}")
-            return format_json_response({"error": str(e)})
+            return {"error": str(e)}
 
     @sync_wrapper
     def find_tag_by_name(self, tag_name: str) -> str:
@@ -210,18 +304,23 @@ class Tags:
         Returns:
             JSON string with tag information if found
         """
+        return format_json_response(self._raw_find_tag_by_name(tag_name))
+
+    def _raw_find_tag_by_name(self, tag_name: str) -> Dict[str, Any]:
+        """Find a tag and return it (or an error dict) before JSON serialization."""
         try:
-            tag = self.issues_api.find_tag_by_name(tag_name)
+            tag = self._lookup_tag(tag_name)
             if tag:
-                return format_json_response(tag)
+                return tag
             else:
-                return format_json_response({"error": f"Tag '{tag_name}' not found"})
+                return {"error": f"Tag '{tag_name}' not found"}
         except Exception as e:
             logger.exception(f"Error finding tag '{tag_name}'")
-            return format_json_response({"error": str(e)})
+            return {"error": str(e)}
 
-    def get_tool_definitions(self) -> Dict[str, Dict[str, Any]]:
-        """Get tool definitions for tag management functions."""
+    @functools.cached_property
+    def tool_definitions(self) -> Dict[str, Dict[str, Any]]:
+        """Tool definitions for tag management functions, built on first access."""
         return {
             "get_available_tags": {
                 "description": "Get all available tags that are owned by or shared with the current user. Example: get_available_tags(query='deploy', limit=20)",
@@ -263,6 +362,14 @@ class Tags:
                     "tag_names": "List of tag names to set (e.g., ['deploy', 'urgent', 'bug'])"
                 }
             },
+            "replace_tag_on_issue": {
+                "description": "Replace one tag on an issue with another in a single update (other tags are kept). Example: replace_tag_on_issue(issue_id='DEMO-123', old_tag_name='in-review', new_tag_name='approved')",
+                "parameter_descriptions": {
+                    "issue_id": "Issue identifier like 'DEMO-123' or 'PROJECT-456'",
+                    "old_tag_name": "Name of the tag currently on the issue",
+                    "new_tag_name": "Name of the tag to put in its place. Tag must exist in YouTrack."
+                }
+            },
             "remove_all_tags_from_issue": {
                 "description": "Remove all tags from an issue. Example: remove_all_tags_from_issue(issue_id='DEMO-123')",
                 "parameter_descriptions": {
@@ -276,3 +383,12 @@ class Tags:
                 }
             }
         }
+
+    def get_tool_definitions(self) -> Dict[str, Dict[str, Any]]:
+        """Get tool definitions for tag management functions.
+
+        Each definition is a shallow copy of the cached one, so callers that
+        annotate definitions (e.g. the loader's ``source_class``) do not write
+        into the cache.
+        """
+        return {name: dict(definition) for name, definition in self.tool_definitions.items()}
@@ -10,7 +10,7 @@ These functions provide infrastructure support for the issue management system.
 """
 
 import logging
-from typing import Any, Dict
+from typing import Any, Dict, List
 
 logger = logging.getLogger(__name__)
 
@@ -23,6 +23,7 @@ class Utilities:
         self.issues_api = issues_api
         self.projects_api = projects_api
         self.client = issues_api.client  # Direct access for cleanup operations
+        self._modules = None  # Module instances, built on first get_tool_definitions()
 
     def close(self) -> None:
         """Close the API client and clean up resources."""
@@ -33,17 +34,15 @@ class Utilities:
         except Exception as e:
             logger.warning(f"Error closing API client: {e}")
 
-    def get_tool_definitions(self) -> Dict[str, Dict[str, Any]]:
+    def _create_modules(self) -> List[Any]:
         """
-        Get consolidated tool definitions from all issue modules.
-        
-        This method consolidates tool definitions from all modular components,
-        providing a comprehensive registry of available tools and their configurations.
-        In the modular architecture, each module maintains its own tool definitions
-        which are aggregated here for system-wide access.
+        Create the issue module instances whose tool definitions are consolidated.
+
+        The instances are kept on this object so that per-instance caches such as
+        ``Tags.tool_definitions`` are reused across get_tool_definitions() calls.
 
         Returns:
-            Dictionary mapping tool names to their configuration
+            List of module instances, or an empty list if the modules cannot be imported
         """
         # Import the modules to get their tool definitions
         try:
@@ -56,10 +55,10 @@ class Utilities:
             from .tags import Tags
         except ImportError as e:
             logger.error(f"Failed to import issue modules: {e}")
-            return {}
+            return []
 
         # Initialize module instances (they need the API clients for tool definitions)
-        modules = [
+        return [
             DedicatedUpdates(self.issues_api, self.projects_api),
             Diagnostics(self.issues_api, self.projects_api),
             CustomFields(self.issues_api, self.projects_api),
@@ -69,6 +68,22 @@ class Utilities:
             Tags(self.issues_api, self.projects_api),
         ]
 
+    def get_tool_definitions(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Get consolidated tool definitions from all issue modules.
+        
+        This method consolidates tool definitions from all modular components,
+        providing a comprehensive registry of available tools and their configurations.
+        In the modular architecture, each module maintains its own tool definitions
+        which are aggregated here for system-wide access.
+
+        Returns:
+            Dictionary mapping tool names to their configuration
+        """
+        if self._modules is None:
+            self._modules = self._create_modules()
+        modules = self._modules
+
         # Consolidate tool definitions from all modules
         consolidated_definitions = {}
         
@@ -3,14 +3,42 @@ Utility functions for YouTrack MCP server.
 """
 
 import json
-from datetime import datetime, timezone
+import time
+from collections import deque
+from functools import lru_cache
 from typing import Any, Dict, List, Union
 
+import orjson
+
+# Epoch-millisecond fields that get an ISO8601 companion, and the companion keys
+_TS_FIELDS = ("created", "updated")
+_TS_FIELD_PAIRS = tuple((field, f"{field}_iso8601") for field in _TS_FIELDS)
+
+_ISO8601_FORMAT = "%04d-%02d-%02dT%02d:%02d:%02d+00:00"
+_ISO8601_MS_FORMAT = "%04d-%02d-%02dT%02d:%02d:%02d.%06d+00:00"
+
+
+@lru_cache(maxsize=4096)
+def _timestamp_to_iso8601(timestamp_ms: int) -> str:
+    """Format a millisecond timestamp as UTC ISO8601, raising on invalid input."""
+    # Split into whole seconds and milliseconds with integer arithmetic
+    seconds, millis = divmod(int(timestamp_ms), 1000)
+    tm = time.gmtime(seconds)
+    if not 1 <= tm.tm_year <= 9999:
+        raise ValueError(f"year {tm.tm_year} is out of range")
+    # Same layout as datetime.isoformat(): the fraction is omitted when zero
+    if millis:
+        return _ISO8601_MS_FORMAT % (*tm[:6], millis * 1000)
+    return _ISO8601_FORMAT % tm[:6]
+
 
 def convert_timestamp_to_iso8601(timestamp_ms: int) -> str:
     """
     Convert YouTrack epoch timestamp (in milliseconds) to ISO8601 format in UTC.
 
+    Conversions are memoized, since the same created/updated values recur
+    throughout large responses.
+
     Args:
         timestamp_ms: Timestamp in milliseconds since Unix epoch
 
@@ -18,73 +46,108 @@ def convert_timestamp_to_iso8601(timestamp_ms: int) -> str:
         ISO8601 formatted timestamp string in UTC timezone
     """
     try:
-        # Convert milliseconds to seconds
-        timestamp_seconds = timestamp_ms / 1000
-        # Create datetime object in UTC and format as ISO8601
-        dt = datetime.fromtimestamp(timestamp_seconds, tz=timezone.utc)
-        return dt.isoformat()
+        return _timestamp_to_iso8601(timestamp_ms)
     except (ValueError, OSError, OverflowError):
         # Return original timestamp as string if conversion fails
         return str(timestamp_ms)
 
 
+def _is_flat_without_timestamps(data: Any) -> bool:
+    """Return True for a dict with no timestamp fields and no nested containers."""
+    return (
+        isinstance(data, dict)
+        and data.keys().isdisjoint(_TS_FIELDS)
+        and not any(type(v) is dict or type(v) is list for v in data.values())
+    )
+
+
 def add_iso8601_timestamps(
     data: Union[Dict, List, Any],
+    _inplace: bool = False,
 ) -> Union[Dict, List, Any]:
     """
-    Recursively add ISO8601 formatted timestamps to YouTrack data.
+    Add ISO8601 formatted timestamps to YouTrack data.
 
     This function looks for timestamp fields (created, updated) that contain
     epoch timestamps in milliseconds and adds corresponding ISO8601 fields.
+    The structure is walked iteratively with an explicit stack, and each dict
+    and list is shallow-copied as it is visited so the input is left unmodified.
 
     Args:
         data: The data structure to process (dict, list, or other)
+        _inplace: Add the fields to ``data`` itself instead of to copies;
+            for callers that own the data and discard it afterwards
 
     Returns:
         The data structure with ISO8601 timestamps added
     """
-    if isinstance(data, dict):
-        # Create a copy to avoid modifying the original
-        result = data.copy()
-
-        # Process timestamp fields
-        timestamp_fields = ["created", "updated"]
-        for field in timestamp_fields:
-            if field in result and isinstance(result[field], int):
-                iso_field = f"{field}_iso8601"
-                result[iso_field] = convert_timestamp_to_iso8601(result[field])
-
-        # Recursively process nested dictionaries and lists
-        for key, value in result.items():
-            if isinstance(value, (dict, list)):
-                result[key] = add_iso8601_timestamps(value)
-
-        return result
-
-    elif isinstance(data, list):
-        # Process each item in the list
-        return [add_iso8601_timestamps(item) for item in data]
-
-    else:
+    if not isinstance(data, (dict, list)):
         # Return unchanged for other types
         return data
+    if not _inplace:
+        data = data.copy()
+    if _is_flat_without_timestamps(data):
+        # Nothing to add, e.g. status and error responses
+        return data
+    stack = deque([data])
+    while stack:
+        node = stack.pop()
+        if isinstance(node, dict):
+            for field, iso_field in _TS_FIELD_PAIRS:
+                value = node.get(field)
+                # Exact check: excludes bools, which YouTrack never sends as timestamps
+                if type(value) is int:
+                    node[iso_field] = convert_timestamp_to_iso8601(value)
+            children = node.items()
+        else:
+            children = enumerate(node)
+        for key, value in children:
+            # Exact type checks: API responses only contain plain dicts and lists
+            t = type(value)
+            if t is dict or t is list:
+                if not _inplace:
+                    value = node[key] = value.copy()
+                stack.append(value)
+    return data
 
 
 def format_json_response(data: Any) -> str:
     """
     Format data as JSON string with ISO8601 timestamps added.
 
+    The enhanced data is serialized with orjson, which differs from
+    json.dumps only in writing non-ASCII characters unescaped and NaN/Infinity
+    as null. Payloads orjson rejects (such as integers beyond 64 bits) are
+    serialized with json.dumps instead.
+
+    Takes ownership of ``data``: the timestamps may be added to it in place,
+    so copy anything that is cached or shared before passing it in.
+
     Args:
         data: The data to format
 
     Returns:
         JSON string with ISO8601 timestamps added
     """
-    # Add ISO8601 timestamps to the data
-    enhanced_data = add_iso8601_timestamps(data)
+    # Flat dicts without timestamps (status and error responses) need no walk
+    if not _is_flat_without_timestamps(data):
+        data = add_iso8601_timestamps(data, _inplace=True)
+    try:
+        return orjson.dumps(
+            data,
+            option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS,
+        ).decode()
+    except orjson.JSONEncodeError:
+        return json.dumps(data, indent=2)
+
+
+_TOOL_DESCRIPTION_TEMPLATE = """{action}
 
-    # Return formatted JSON
-    return json.dumps(enhanced_data, indent=2)
+🎯 USE WHEN: {use_when}
+✅ RETURNS: {returns}
+⚠️ IMPORTANT: {important}
+
+Example: {example}"""
 
 
 def create_enhanced_tool_description(
@@ -120,10 +183,10 @@ def create_enhanced_tool_description(
         ...     example='get_custom_field_allowed_values(project_id="AI", field_name="Type")'
         ... )
     """
-    return f"""{action}
-
-🎯 USE WHEN: {use_when}
-✅ RETURNS: {returns}
-⚠️ IMPORTANT: {important}
-
-Example: {example}"""
+    return _TOOL_DESCRIPTION_TEMPLATE.format(
+        action=action,
+        use_when=use_when,
+        returns=returns,
+        important=important,
+        example=example,
+    )